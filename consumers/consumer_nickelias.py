@@ -27,13 +27,24 @@ Environment variables are managed via the utils/utils_config module.
 #####################################
 
 # Import standard library modules
-import json
+import argparse
 import pathlib
 import sys
 import time
-import csv
 import sqlite3
 import os
+import queue
+import threading
+from typing import Optional
+
+# Import external packages
+import msgspec
+
+# inotify_simple is optional and Linux-only; without it the consumer polls with time.sleep
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
 
 # Import local utility modules
 import utils.utils_config as config
@@ -49,68 +60,219 @@ from utils.utils_logger import logger
 CSV_FILE_PATH = pathlib.Path("data") / "live_data.csv"
 
 
+#####################################
+# Define Processed Message Type
+#####################################
+
+class ProcessedMessage(msgspec.Struct, frozen=True):
+    """A processed message, with fields in the same order as the database and CSV columns."""
+
+    message: str
+    author: str
+    timestamp: str
+    category: str
+    sentiment: float = 0.0
+    keyword_mentioned: str = ""
+
+
+#####################################
+# Define JSON Decoder
+#####################################
+
+# Reusable decoder that parses a raw JSON line straight into a ProcessedMessage.
+# Unknown fields such as message_length are skipped, and strict=False lets
+# numeric strings like "0.87" convert to floats the way float() did.
+JSON_DECODER = msgspec.json.Decoder(ProcessedMessage, strict=False)
+
+
+#####################################
+# Define Batching Settings
+#####################################
+
+# Maximum number of processed messages to write to the database and CSV file at once.
+BATCH_SIZE = 500
+
+# Maximum number of processed messages waiting for the persister thread before the consumer blocks.
+MESSAGE_QUEUE_MAXSIZE = 10 * BATCH_SIZE
+
+# How long the consumer waits on a full queue before checking that the persister is still running.
+QUEUE_PUT_TIMEOUT_SECS = 1.0
+
+
+#####################################
+# Define SQLite Connection Settings
+#####################################
+
+# Pragmas applied to every connection when it is opened.
+# WAL with synchronous=NORMAL avoids an fsync per commit; the rest enlarge caches
+# and let a concurrent reader wait briefly instead of failing with SQLITE_BUSY.
+# busy_timeout comes first so the journal mode switch also waits for a lock.
+SQLITE_PRAGMAS = """
+    PRAGMA busy_timeout=3000;
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+"""
+
+
+#####################################
+# Define SQL Statements
+#####################################
+
+# Statements run for every batch. sqlite3 caches compiled statements by their SQL text
+# (128 per connection by default), so keeping each one as a single constant string
+# means it is compiled once per connection.
+INSERT_MESSAGE_SQL = """
+    INSERT INTO streamed_messages (
+        message, author, timestamp, category, sentiment, keyword_mentioned
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Adds a batch's sentiment sum and message count to the running totals.
+# SET expressions see the row's old values, so the average uses the updated totals.
+UPDATE_SENTIMENT_INSIGHTS_SQL = """
+    UPDATE sentiment_insights
+    SET sum_sentiment = sum_sentiment + ?,
+        total_messages = total_messages + ?,
+        average_sentiment = (sum_sentiment + ?) / (total_messages + ?),
+        last_updated = ?
+    WHERE id = 1
+"""
+
+
 #####################################
 # Function to Process a Single Message
 #####################################
 
-def process_message(message: dict) -> None:
+def process_message(line: bytes) -> Optional[ProcessedMessage]:
     """
-    Processes a single JSON message, extracting relevant fields and converting them to appropriate data types.
+    Processes a single JSON line, parsing and converting its fields to the appropriate data types
+    in one pass with JSON_DECODER.
 
     Args:
-        message (dict): A dictionary containing the message's data, including message, author, timestamp,
-                        category, sentiment, and keyword mentioned.
+        line (bytes): One line from the live data file containing the message's data, including
+                      message, author, timestamp, category, sentiment, and keyword mentioned.
 
     Returns:
-        dict: Processed message with proper data types (e.g., converting sentiment to a float).
+        ProcessedMessage: Processed message with proper data types, or None if the line is malformed
+                          or is missing a required field.
     """
     try:
-        processed_message = {
-            "message": message.get("message"),
-            "author": message.get("author"),
-            "timestamp": message.get("timestamp"),
-            "category": message.get("category"),
-            "sentiment": float(message.get("sentiment", 0.0)),
-            "keyword_mentioned": message.get("keyword_mentioned"),
-        }
-        logger.info(f"Processed message: {processed_message}")
+        # msgspec ignores the trailing newline
+        processed_message = JSON_DECODER.decode(line)
+
+        # TRACE is below loguru's default handler levels, so this returns before formatting
+        logger.trace("Processed message: {}", processed_message)
         return processed_message
-    except Exception as e:
-        logger.error(f"Error processing message: {e}")
+    except (msgspec.DecodeError, UnicodeDecodeError) as e:
+        logger.error(f"ERROR: Skipping malformed message: {e}")
         return None
 
 
 #####################################
-# Function to Append Data to CSV
+# Functions to Write Data to CSV
 #####################################
 
-def append_to_csv(processed_message):
+def format_csv_row(message: ProcessedMessage) -> str:
     """
-    Appends a processed message to a CSV file for logging purposes.
-    If the CSV file doesn't exist, it writes a header row.
+    Formats a processed message as one CSV line, matching csv.writer's default output.
+
+    Only the free-text message field can contain commas, quotes, or line breaks, so it is
+    the only field that may need quoting. The other fields are short values from the
+    producer's fixed vocabulary and are written as-is.
 
     Args:
-        processed_message (dict): The message data to be written to the CSV file.
+        message (ProcessedMessage): The message to format.
+
+    Returns:
+        str: The CSV line, including the line terminator.
     """
-    file_exists = os.path.exists(CSV_FILE_PATH)
+    text = message.message
+    if '"' in text or "," in text or "\n" in text or "\r" in text:
+        text = '"' + text.replace('"', '""') + '"'
+    return (
+        f"{text},{message.author},{message.timestamp},{message.category},"
+        f"{message.sentiment!r},{message.keyword_mentioned}\r\n"
+    )
+
+
+def open_csv_file(csv_path: pathlib.Path):
+    """
+    Opens the CSV file once for appending.
+    If the CSV file doesn't exist or is empty, it writes a header row.
+
+    Args:
+        csv_path (pathlib.Path): Path to the CSV file.
 
+    Returns:
+        The open CSV file object.
+    """
+    # Use a large buffer so rows are only written out when a batch is flushed
+    file = open(csv_path, mode="a", newline="", buffering=1 << 16)
+
+    # Append mode starts at the end of the file, so position 0 means it is new or empty
+    if file.tell() == 0:
+        file.write(",".join(ProcessedMessage.__struct_fields__) + "\r\n")
+    return file
+
+
+def append_batch_to_csv(file, batch: list) -> bool:
+    """
+    Appends a batch of processed messages to the CSV file for logging purposes
+    and flushes it to disk.
+
+    Args:
+        file: CSV file object returned by open_csv_file.
+        batch (list): ProcessedMessage objects to be written to the CSV file.
+
+    Returns:
+        bool: True if the batch was written, False if writing or flushing failed.
+    """
     try:
-        # Open the CSV file in append mode, create it if it doesn't exist
-        with open(CSV_FILE_PATH, mode="a", newline="") as file:
-            writer = csv.writer(file)
-            # Write header only if the file doesn't already exist
-            if not file_exists:
-                writer.writerow(["message", "author", "timestamp", "category", "sentiment", "keyword_mentioned"])
-            writer.writerow([
-                processed_message["message"],
-                processed_message["author"],
-                processed_message["timestamp"],
-                processed_message["category"],
-                processed_message["sentiment"],
-                processed_message["keyword_mentioned"],
-            ])
+        file.write("".join(map(format_csv_row, batch)))
+
+        # With a large buffer, write errors such as a full disk usually surface here
+        file.flush()
+        return True
     except Exception as e:
         logger.error(f"ERROR: Failed to write to CSV file: {e}")
+        return False
+
+
+def close_csv_file(file) -> None:
+    """
+    Closes the CSV file, logging instead of raising if buffered rows cannot be written.
+
+    Args:
+        file: CSV file object returned by open_csv_file.
+    """
+    try:
+        file.close()
+    except Exception as e:
+        logger.error(f"ERROR: Failed to close CSV file: {e}")
+
+
+#####################################
+# Function to Open a Database Connection
+#####################################
+
+def connect_db(db_path: pathlib.Path, isolation_level: Optional[str] = "") -> sqlite3.Connection:
+    """
+    Opens a connection to the SQLite database and applies SQLITE_PRAGMAS.
+
+    Args:
+        db_path (pathlib.Path): Path to the SQLite database file.
+        isolation_level (str): Passed to sqlite3.connect. Use None for autocommit mode,
+                               where the caller issues BEGIN/COMMIT itself.
+
+    Returns:
+        sqlite3.Connection: Configured connection to the database.
+    """
+    conn = sqlite3.connect(db_path, isolation_level=isolation_level)
+    conn.executescript(SQLITE_PRAGMAS)
+    return conn
 
 
 #####################################
@@ -131,15 +293,14 @@ def init_db(db_path: pathlib.Path):
         # Create directory for database if it doesn't exist
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
-        with sqlite3.connect(db_path) as conn:
+        with connect_db(db_path) as conn:
             cursor = conn.cursor()
 
-            # Drop existing table if it exists, and create new tables
-            cursor.execute("DROP TABLE IF EXISTS streamed_messages;")
+            # Create the tables if they don't exist yet, keeping any existing data
             cursor.execute(
                 """
                 CREATE TABLE IF NOT EXISTS streamed_messages (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER PRIMARY KEY,
                     message TEXT,
                     author TEXT,
                     timestamp TEXT,
@@ -156,17 +317,24 @@ def init_db(db_path: pathlib.Path):
                 CREATE TABLE IF NOT EXISTS sentiment_insights (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     average_sentiment REAL,
+                    sum_sentiment REAL,
                     total_messages INTEGER,
                     last_updated TEXT
                 )
             """
             )
 
+            # Databases created before sum_sentiment was added need the column and its backfill
+            columns = [row[1] for row in cursor.execute("PRAGMA table_info(sentiment_insights)")]
+            if "sum_sentiment" not in columns:
+                cursor.execute("ALTER TABLE sentiment_insights ADD COLUMN sum_sentiment REAL")
+                cursor.execute("UPDATE sentiment_insights SET sum_sentiment = average_sentiment * total_messages")
+
             # Ensure at least one row exists for sentiment insights tracking
             cursor.execute("SELECT COUNT(*) FROM sentiment_insights")
             if cursor.fetchone()[0] == 0:
                 cursor.execute(
-                    "INSERT INTO sentiment_insights (average_sentiment, total_messages, last_updated) VALUES (0.0, 0, datetime('now'))"
+                    "INSERT INTO sentiment_insights (average_sentiment, sum_sentiment, total_messages, last_updated) VALUES (0.0, 0.0, 0, datetime('now'))"
                 )
 
             conn.commit()
@@ -175,55 +343,225 @@ def init_db(db_path: pathlib.Path):
 
 
 #####################################
-# Function to Insert Processed Message into the Database
+# Function to Reset the Database
 #####################################
 
-def insert_message(message: dict, db_path: pathlib.Path) -> None:
+def reset_db(db_path: pathlib.Path):
     """
-    Inserts a processed message into the SQLite database and updates sentiment insights.
+    Clears all stored messages and resets sentiment insights, keeping the database file,
+    its WAL, and its schema in place. The database must already be initialized with init_db.
 
     Args:
-        message (dict): Processed message data to insert into the database.
         db_path (pathlib.Path): Path to the SQLite database file.
 
     Raises:
-        Exception: If there's an error in inserting the message or updating sentiment insights.
+        Exception: If there's an error in resetting the database.
     """
     try:
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO streamed_messages (
-                    message, author, timestamp, category, sentiment, keyword_mentioned
-                ) VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    message["message"],
-                    message["author"],
-                    message["timestamp"],
-                    message["category"],
-                    message["sentiment"],
-                    message["keyword_mentioned"],
-                ),
-            )
+        conn = connect_db(db_path)
+        try:
+            with conn:
+                # DELETE without a WHERE clause lets SQLite truncate the table in one step
+                conn.execute("DELETE FROM streamed_messages")
+                conn.execute(
+                    """
+                    UPDATE sentiment_insights
+                    SET average_sentiment = 0.0, sum_sentiment = 0.0, total_messages = 0, last_updated = datetime('now')
+                    WHERE id = 1
+                    """
+                )
+        finally:
+            conn.close()
+    except Exception as e:
+        logger.error(f"ERROR: Failed to reset database: {e}")
 
-            # Update sentiment insights based on total messages and average sentiment
-            cursor.execute("SELECT COUNT(*), AVG(sentiment) FROM streamed_messages")
-            total_messages, avg_sentiment = cursor.fetchone()
 
-            cursor.execute(
-                """
-                UPDATE sentiment_insights 
-                SET average_sentiment = ?, total_messages = ?, last_updated = datetime('now')
-                WHERE id = (SELECT id FROM sentiment_insights ORDER BY last_updated DESC LIMIT 1)
-                """,
-                (avg_sentiment, total_messages),
+#####################################
+# Function to Insert Processed Message into the Database
+#####################################
+
+def insert_message(batch: list, conn: sqlite3.Connection) -> None:
+    """
+    Inserts a batch of processed messages into the SQLite database in a single transaction
+    and updates sentiment insights once for the whole batch.
+
+    Args:
+        batch (list): ProcessedMessage objects to insert into the database.
+        conn (sqlite3.Connection): Open connection to the SQLite database in autocommit mode
+                                   (isolation_level=None).
+
+    Raises:
+        Exception: If there's an error in inserting the messages or updating sentiment insights.
+    """
+    try:
+        rows = [msgspec.structs.astuple(message) for message in batch]
+        batch_count = len(rows)
+        batch_sum = sum(message.sentiment for message in batch)
+
+        # Same UTC format as SQLite's datetime('now'), computed once per batch
+        last_updated = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+
+        # Take the write lock up front so the batch never has to upgrade from a read lock
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(INSERT_MESSAGE_SQL, rows)
+
+            # Fold the batch into the running totals kept in the sentiment insights row
+            conn.execute(
+                UPDATE_SENTIMENT_INSIGHTS_SQL,
+                (batch_sum, batch_count, batch_sum, batch_count, last_updated),
             )
+            conn.execute("COMMIT")
+        except Exception:
+            # SQLite may already have rolled back (e.g. a failed COMMIT on a full disk)
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+    except Exception as e:
+        logger.error(f"ERROR: Failed to insert messages and update sentiment insights: {e}")
 
-            conn.commit()
+
+#####################################
+# Functions to Wait for New Live Data
+#####################################
+
+def create_file_watcher(live_data_path: pathlib.Path):
+    """
+    Creates an inotify watcher on the live data file's folder, if inotify is available.
+
+    The folder is watched rather than the file so the watch survives the producer
+    deleting and recreating the live data file.
+
+    Args:
+        live_data_path (pathlib.Path): Path to the live data file.
+
+    Returns:
+        INotify or None: The watcher, or None if the consumer should fall back to polling.
+    """
+    if INotify is None:
+        return None
+
+    try:
+        watcher = INotify()
+        watcher.add_watch(live_data_path.parent, inotify_flags.MODIFY | inotify_flags.CREATE)
+        return watcher
     except Exception as e:
-        logger.error(f"ERROR: Failed to insert message and update sentiment insights: {e}")
+        logger.warning(f"WARNING: inotify unavailable, falling back to polling: {e}")
+        return None
+
+
+def wait_for_new_data(watcher, live_data_path: pathlib.Path, interval_secs: int) -> None:
+    """
+    Blocks until the live data file changes or interval_secs have passed.
+
+    The watched folder also holds the consumer's own outputs (the CSV file and the SQLite
+    WAL), so events for any other file are ignored and the wait continues.
+
+    Args:
+        watcher: INotify instance returned by create_file_watcher, or None to poll.
+        live_data_path (pathlib.Path): Path to the live data file.
+        interval_secs (int): Maximum time in seconds to wait.
+    """
+    if watcher is None:
+        time.sleep(interval_secs)
+        return
+
+    deadline = time.monotonic() + interval_secs
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        events = watcher.read(timeout=int(remaining * 1000))
+        if any(event.name == live_data_path.name for event in events):
+            return
+
+
+#####################################
+# Function to Persist Messages on a Background Thread
+#####################################
+
+def persist_messages(message_queue: queue.Queue, sql_path: pathlib.Path, csv_path: pathlib.Path) -> None:
+    """
+    Runs on a background thread, writing processed messages from message_queue to the
+    database and CSV file in batches. A None item stops the persister.
+
+    The persister blocks for the next message, then drains whatever else is already
+    queued (up to BATCH_SIZE) and writes it as one batch. Under load batches fill up;
+    when messages trickle in, each is written as soon as it arrives.
+
+    The SQLite connection and CSV file are opened here and used only by this thread.
+    If the database cannot be opened, the persister logs the error and stops. If the
+    CSV file cannot be opened or written, CSV logging is turned off and messages are
+    still written to the database.
+
+    Args:
+        message_queue (queue.Queue): Queue of ProcessedMessage objects to store.
+        sql_path (pathlib.Path): Path to the SQLite database file.
+        csv_path (pathlib.Path): Path to the CSV file.
+    """
+    conn = None
+    csv_file = None
+    stopping = False
+
+    try:
+        try:
+            # Autocommit mode, so insert_message controls each batch's transaction explicitly
+            conn = connect_db(sql_path, isolation_level=None)
+        except Exception as e:
+            logger.error(f"ERROR: Failed to open database, stopping persister: {e}")
+            return
+
+        try:
+            csv_file = open_csv_file(csv_path)
+        except Exception as e:
+            logger.error(f"ERROR: Failed to open CSV file, continuing without CSV logging: {e}")
+
+        while not stopping:
+            batch = [message_queue.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(message_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if batch[-1] is None:
+                stopping = True
+                batch.pop()
+
+            if batch:
+                insert_message(batch, conn)
+                if csv_file is not None and not append_batch_to_csv(csv_file, batch):
+                    logger.error("ERROR: Continuing without CSV logging.")
+                    close_csv_file(csv_file)
+                    csv_file = None
+    finally:
+        try:
+            if csv_file is not None:
+                close_csv_file(csv_file)
+        finally:
+            if conn is not None:
+                conn.close()
+
+
+def put_for_persister(message_queue: queue.Queue, persister: threading.Thread, item) -> bool:
+    """
+    Puts an item on the persister's queue, waiting while the queue is full.
+
+    Args:
+        message_queue (queue.Queue): Queue read by persist_messages.
+        persister (threading.Thread): The thread running persist_messages.
+        item: ProcessedMessage to store, or None to stop the persister.
+
+    Returns:
+        bool: True if the item was queued, False if the persister has stopped.
+    """
+    while persister.is_alive():
+        try:
+            message_queue.put(item, timeout=QUEUE_PUT_TIMEOUT_SECS)
+            return True
+        except queue.Full:
+            pass
+    return False
 
 
 #####################################
@@ -233,53 +571,99 @@ def insert_message(message: dict, db_path: pathlib.Path) -> None:
 def consume_messages_from_file(live_data_path, sql_path, interval_secs, last_position):
     """
     Continuously consumes new messages from a live data file, processes them, and stores them
-    in both the database and CSV file.
+    in both the database and CSV file. The caller must initialize the database with init_db first.
+
+    This thread only reads and parses messages. Processed messages are handed to a
+    persist_messages thread through a bounded queue, which writes them to the database
+    and CSV file in batches. If the persister falls behind, the queue fills up and the
+    consumer blocks until there is room. If the persister stops, the consumer logs an
+    error and exits.
+
+    The live data file is kept open and read incrementally. When caught up, the consumer
+    waits on inotify events (Linux, with inotify_simple installed) and otherwise sleeps
+    for interval_secs.
 
     Args:
         live_data_path (pathlib.Path): Path to the live data file (e.g., JSON messages).
         sql_path (pathlib.Path): Path to the SQLite database file.
         interval_secs (int): Time interval in seconds to check for new messages.
-        last_position (int): The last position in the file that was read.
+        last_position (int): The position in the file to start reading from.
 
     Raises:
         Exception: If an error occurs during file reading or message processing.
     """
     logger.info("Started consuming messages from file.")
 
-    # Initialize the database
-    init_db(sql_path)
+    # Database and CSV writes happen on the persister thread
+    message_queue = queue.Queue(maxsize=MESSAGE_QUEUE_MAXSIZE)
+    persister = threading.Thread(
+        target=persist_messages, args=(message_queue, sql_path, CSV_FILE_PATH), daemon=True
+    )
+    persister.start()
+    watcher = create_file_watcher(live_data_path)
+
+    # The live data file is opened once and then read incrementally as it grows
+    file = None
+
+    try:
+        while True:
+            try:
+                if file is None:
+                    file = open(live_data_path, "rb")
+                    file.seek(last_position)
+
+                    # The file is only ever read front to back, so ask the kernel for more readahead
+                    if hasattr(os, "posix_fadvise"):
+                        os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
 
-    # Start reading from the file from the last read position
-    while True:
-        try:
-            with open(live_data_path, "r") as file:
-                file.seek(last_position)
                 new_data_found = False  # Flag to track if new messages are read
 
                 for line in file:
-                    if line.strip():  # Only process non-empty lines
-                        new_data_found = True
-                        message = json.loads(line.strip())  # Parse the JSON message
-
-                        # Process the message and insert it into the database and CSV
-                        processed_message = process_message(message)
-                        if processed_message:
-                            insert_message(processed_message, sql_path)
-                            append_to_csv(processed_message)
+                    # Leave a partially written last line for the next pass
+                    if not line.endswith(b"\n"):
+                        file.seek(-len(line), os.SEEK_CUR)
+                        break
 
-                # Update the last read position in the file
-                last_position = file.tell()
+                    if not line.isspace():  # Skip blank lines, including bare \r\n
+                        new_data_found = True
 
-            if not new_data_found:
-                logger.info("No new messages found, sleeping...")
+                        # Process the message and hand it to the persister thread
+                        processed_message = process_message(line)
+                        if processed_message is not None and not put_for_persister(message_queue, persister, processed_message):
+                            logger.error("ERROR: Persister thread stopped, exiting.")
+                            sys.exit(3)
+
+                if not new_data_found:
+                    if not persister.is_alive():
+                        logger.error("ERROR: Persister thread stopped, exiting.")
+                        sys.exit(3)
+
+                    # The producer recreates the live data file on restart, so start over on the new file
+                    if os.stat(live_data_path).st_ino != os.fstat(file.fileno()).st_ino:
+                        logger.info("Live data file was replaced, reopening it.")
+                        file.close()
+                        file = None
+                        last_position = 0
+                        continue
+
+                    logger.debug("No new messages found, waiting...")
+                    wait_for_new_data(watcher, live_data_path, interval_secs)
+
+            except FileNotFoundError:
+                logger.error(f"ERROR: Live data file not found. Retrying in {interval_secs} seconds.")
+                time.sleep(interval_secs)
+            except Exception as e:
+                logger.error(f"ERROR: Unexpected error occurred: {e}")
                 time.sleep(interval_secs)
+    finally:
+        if file is not None:
+            file.close()
+        if watcher is not None:
+            watcher.close()
 
-        except FileNotFoundError:
-            logger.error(f"ERROR: Live data file not found. Retrying in {interval_secs} seconds.")
-            time.sleep(interval_secs)
-        except Exception as e:
-            logger.error(f"ERROR: Unexpected error occurred: {e}")
-            time.sleep(interval_secs)
+        # Let the persister write everything already queued, then stop
+        if put_for_persister(message_queue, persister, None):
+            persister.join()
 
 
 #####################################
@@ -291,7 +675,18 @@ def main():
     The main function to run the message consumer process.
 
     Reads environment variables, initializes the database, and starts consuming messages from the live data file.
+
+    By default, data from a previous run is cleared while the database file is kept. Pass --fresh
+    to delete and recreate the database file instead, e.g. after a schema change.
     """
+    parser = argparse.ArgumentParser(description="Consume live data messages into SQLite and CSV.")
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="delete and recreate the database file instead of clearing its tables",
+    )
+    args = parser.parse_args()
+
     logger.info("Starting message consumer process.")
 
     try:
@@ -303,16 +698,18 @@ def main():
         logger.error(f"ERROR: Failed to read environment variables: {e}")
         sys.exit(1)
 
-    # Delete previous database file if it exists
-    if sqlite_path.exists():
+    if args.fresh:
+        # Delete the previous database file, along with its WAL and shared-memory files
         try:
-            sqlite_path.unlink()
+            for suffix in ("", "-wal", "-shm"):
+                sqlite_path.with_name(sqlite_path.name + suffix).unlink(missing_ok=True)
         except Exception as e:
             logger.error(f"ERROR: Failed to delete old DB file: {e}")
             sys.exit(2)
 
-    # Initialize a fresh database
+    # Initialize the database, then clear any data left from a previous run
     init_db(sqlite_path)
+    reset_db(sqlite_path)
 
     # Start consuming and processing messages
     consume_messages_from_file(live_data_path, sqlite_path, interval_secs, 0)